@@ -65,6 +65,7 @@ DEFAULT_VALUES = {
     "enable_logging": True,
     "quiet_mode": False,
     "log_level": "WARNING",
+    "log_file": "app.log",
     
     # --- User Management ---
     "create_user": None,
@@ -0,0 +1,29 @@
+"""
+Cached JSON file loading shared by the plugins.
+
+File contents are cached by path and modification time, so repeated loads of
+an unchanged file skip the disk read. Every load parses a fresh object, so no
+state is shared between callers.
+"""
+
+import json
+import os
+from functools import lru_cache
+
+@lru_cache(maxsize=32)
+def _read_text(path, mtime):
+    """Read a file's text, cached by path and modification time."""
+    with open(path, 'r') as f:
+        return f.read()
+
+def load_json(path):
+    """
+    Parse a JSON file, reusing its cached text while the file is unchanged.
+
+    Args:
+        path (str): Path to the JSON file
+
+    Returns:
+        The parsed JSON; each call returns a new object the caller may mutate.
+    """
+    return json.loads(_read_text(path, os.path.getmtime(path)))
@@ -58,7 +58,8 @@ def setup_logging(config: Dict[str, Any]):
     Setup logging configuration based on config options.
 
     Priority: PREDICTION_PROVIDER_QUIET=1 env var > quiet_mode config > log_level config.
-    Defaults to WARNING if none specified.
+    Defaults to WARNING if none specified. Records are also written to the
+    ``log_file`` config path (``app.log`` by default).
 
     :param config: Application configuration dictionary
     :type config: Dict[str, Any]
@@ -81,7 +82,7 @@ def setup_logging(config: Dict[str, Any]):
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler('app.log')
+            logging.FileHandler(config.get('log_file', 'app.log'))
         ],
         force=True,
     )
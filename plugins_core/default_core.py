@@ -12,12 +12,13 @@ import os as _os
 _QUIET = _os.environ.get('PREDICTION_PROVIDER_QUIET', '0') == '1'
 
 import os
+import sys
 import importlib
 import threading
 import uuid
 import asyncio
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from fastapi import FastAPI, HTTPException, Depends, Request, BackgroundTasks
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
@@ -290,9 +291,16 @@ async def optional_auth(request: Request, db: Session = Depends(get_db)):
     # If authentication is not required, allow public access
     return None
 
+def get_prediction_runner() -> Callable[..., None]:
+    """Dependency returning the callable that runs a prediction in the background.
+
+    Resolved per request so tests can swap it via ``app.dependency_overrides``.
+    """
+    return run_prediction_task_sync
+
 # Main prediction endpoints (flexible: public or authenticated)
 @app.post("/api/v1/predictions/", response_model=PredictionResponse, status_code=201)
-async def create_prediction(request: PredictionRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db), current_user: User = Depends(optional_auth)):
+async def create_prediction(request: PredictionRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db), current_user: User = Depends(optional_auth), run_prediction: Callable[..., None] = Depends(get_prediction_runner)):
     """Create a new prediction request (flexible authentication)."""
     try:
         # If user is authenticated, check if they have permission to create predictions
@@ -335,7 +343,7 @@ async def create_prediction(request: PredictionRequest, background_tasks: Backgr
         db.refresh(prediction)
         
         # Start background prediction task using FastAPI's BackgroundTasks
-        background_tasks.add_task(run_prediction_task_sync, prediction.id, prediction.task_id)
+        background_tasks.add_task(run_prediction, prediction.id, prediction.task_id)
         
         return PredictionResponse(
             id=prediction.id,
@@ -430,7 +438,7 @@ async def delete_prediction(prediction_id: int, db: Session = Depends(get_db), c
 
 # Add protected prediction endpoints (for security/production tests)
 @app.post("/api/v1/secure/predictions/", response_model=PredictionResponse, status_code=201)
-async def create_prediction_secure(request: PredictionRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def create_prediction_secure(request: PredictionRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db), current_user: User = Depends(get_current_user), run_prediction: Callable[..., None] = Depends(get_prediction_runner)):
     """Create a new prediction request (secure endpoint)."""
     try:
         # Create new prediction record with user association
@@ -453,7 +461,7 @@ async def create_prediction_secure(request: PredictionRequest, background_tasks:
         db.refresh(prediction)
         
         # Start background prediction task using FastAPI's BackgroundTasks
-        background_tasks.add_task(run_prediction_task_sync, prediction.id, prediction.task_id)
+        background_tasks.add_task(run_prediction, prediction.id, prediction.task_id)
         
         return PredictionResponse(
             id=prediction.id,
@@ -570,7 +578,7 @@ async def get_prediction_status_legacy(prediction_id: str, db: Session = Depends
 
 # Add predict endpoint for acceptance tests that expect it
 @app.post("/predict")
-async def predict_legacy(request: dict, background_tasks: BackgroundTasks, db: Session = Depends(get_db), current_user: User = Depends(optional_auth)):
+async def predict_legacy(request: dict, background_tasks: BackgroundTasks, db: Session = Depends(get_db), current_user: User = Depends(optional_auth), run_prediction: Callable[..., None] = Depends(get_prediction_runner)):
     """Legacy predict endpoint for backward compatibility."""
     # Convert legacy format to new format
     prediction_request = PredictionRequest(
@@ -601,7 +609,7 @@ async def predict_legacy(request: dict, background_tasks: BackgroundTasks, db: S
     db.refresh(prediction)
     
     # Start background prediction task using FastAPI's BackgroundTasks
-    background_tasks.add_task(run_prediction_task_sync, prediction.id, prediction.task_id)
+    background_tasks.add_task(run_prediction, prediction.id, prediction.task_id)
     
     return {
         "prediction_id": prediction.task_id,
@@ -611,7 +619,7 @@ async def predict_legacy(request: dict, background_tasks: BackgroundTasks, db: S
 
 # Add predict endpoint for integration tests
 @app.post("/api/v1/predict", response_model=PredictionResponse, status_code=201)
-async def predict_api(prediction_request: PredictionRequest, background_tasks: BackgroundTasks, request: Request, db: Session = Depends(get_db)):
+async def predict_api(prediction_request: PredictionRequest, background_tasks: BackgroundTasks, request: Request, db: Session = Depends(get_db), run_prediction: Callable[..., None] = Depends(get_prediction_runner)):
     """Create a new prediction request via the /api/v1/predict endpoint (public or authenticated)."""
     user_id = None
     
@@ -671,7 +679,7 @@ async def predict_api(prediction_request: PredictionRequest, background_tasks: B
     
     # Start background prediction task (skip in test environment)
     if os.getenv("SKIP_BACKGROUND_TASKS", "false").lower() != "true":
-        background_tasks.add_task(run_prediction_task_sync, prediction.id, prediction.task_id, user_id)
+        background_tasks.add_task(run_prediction, prediction.id, prediction.task_id, user_id)
     
     return PredictionResponse(
         id=prediction.id,
@@ -798,8 +806,10 @@ async def plugin_status():
 
 class PluginManager:
     """A simple manager to register and retrieve plugins by name."""
+    __slots__ = ("_plugins",)
+
     def __init__(self):
-        self._plugins = {}
+        self._plugins: Dict[str, Any] = {}
 
     def register(self, plugin):
         """Registers a plugin instance."""
@@ -807,7 +817,11 @@ class PluginManager:
             # The test uses a mock with a .name attribute.
             # This check makes the class more robust.
             return
-        self._plugins[plugin.name] = plugin
+        name = plugin.name
+        if type(name) is str:
+            # Interned keys let lookups with literal names match by identity
+            name = sys.intern(name)
+        self._plugins[name] = plugin
 
     def get(self, name):
         """Retrieves a plugin by its name."""
@@ -1289,7 +1303,7 @@ async def modify_audit_log(log_id: int, request: dict, current_user: User = Depe
 
 # Add protected prediction endpoint for authenticated users
 @app.post("/api/v1/auth/predictions/", response_model=PredictionResponse, status_code=201)
-async def create_prediction_protected(request: PredictionRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def create_prediction_protected(request: PredictionRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db), current_user: User = Depends(get_current_user), run_prediction: Callable[..., None] = Depends(get_prediction_runner)):
     """Create a new prediction request (authenticated endpoint)."""
     try:
         # Create new prediction record with user association
@@ -1311,7 +1325,7 @@ async def create_prediction_protected(request: PredictionRequest, background_tas
         db.refresh(prediction)
         
         # Start background prediction task using FastAPI's BackgroundTasks
-        background_tasks.add_task(run_prediction_task_sync, prediction.id, prediction.task_id)
+        background_tasks.add_task(run_prediction, prediction.id, prediction.task_id)
         
         return PredictionResponse(
             id=prediction.id,
@@ -16,6 +16,9 @@ import json
 from datetime import datetime, timedelta
 import requests
 import os
+
+from app.json_cache import load_json
+
 try:
     import pandas_ta as ta
 except Exception:  # optional dependency
@@ -43,6 +46,7 @@ class DefaultFeeder:
         "batch_size": 256,
         "window_size": 256,
         "use_normalization_json": None,
+        "normalization_params": None,  # Pre-parsed params; takes precedence over the JSON path
         "target_column": "CLOSE",
     }
     
@@ -60,9 +64,6 @@ class DefaultFeeder:
         if config:
             self.set_params(**config)
 
-        if self.params.get("use_normalization_json"):
-            self._load_normalization_params()
-
         if self.params.get("data_source") == "file" and self.params.get("data_file_path"):
             self._load_file_data()
 
@@ -82,14 +83,17 @@ class DefaultFeeder:
         self._file_df_cache = df
 
     def _load_normalization_params(self):
+        if self.params.get("normalization_params"):
+            self.normalization_params = self.params["normalization_params"]
+            return
+
         path = self.params.get("use_normalization_json")
         if not path:
             self.normalization_params = {}
             return
             
         try:
-            with open(path, 'r') as f:
-                self.normalization_params = json.load(f)
+            self.normalization_params = load_json(path)
         except (FileNotFoundError, json.JSONDecodeError) as e:
             if not _QUIET: print(f"Warning: Could not load or parse normalization file at {path}. Error: {e}")
             self.normalization_params = {}
@@ -100,7 +104,7 @@ class DefaultFeeder:
         """
         for key, value in kwargs.items():
             self.params[key] = value
-        if 'use_normalization_json' in kwargs:
+        if 'use_normalization_json' in kwargs or 'normalization_params' in kwargs:
             self._load_normalization_params()
         if 'data_file_path' in kwargs or 'data_source' in kwargs or 'date_column' in kwargs:
             if self.params.get("data_source") == "file" and self.params.get("data_file_path"):
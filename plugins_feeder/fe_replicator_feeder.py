@@ -19,6 +19,69 @@ import importlib.util
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
+# Wavelet features feature-eng emits for CLOSE
+_WAVELET_FEATURES = ('CLOSE_wav_detail_L1', 'CLOSE_wav_detail_L2', 'CLOSE_wav_approx_L2')
+_WAVELET_FEATURE_SET = frozenset(_WAVELET_FEATURES)
+
+# Final column order of the feature-eng output
+_EXPECTED_COLUMN_ORDER = (
+    'DATE_TIME',
+    'RSI',
+    'MACD',
+    'MACD_Histogram',
+    'MACD_Signal',
+    'EMA',
+    'Stochastic_%K',
+    'Stochastic_%D',
+    'ADX',
+    'DI+',
+    'DI-',
+    'ATR',
+    'CCI',
+    'WilliamsR',
+    'Momentum',
+    'ROC',
+    'OPEN',
+    'HIGH',
+    'LOW',
+    'BC-BO',
+    'BH-BL',
+    'BH-BO',
+    'BO-BL',
+    'S&P500_Close',
+    'vix_close',
+    'CLOSE_15m_tick_1',
+    'CLOSE_15m_tick_2',
+    'CLOSE_15m_tick_3',
+    'CLOSE_15m_tick_4',
+    'CLOSE_15m_tick_5',
+    'CLOSE_15m_tick_6',
+    'CLOSE_15m_tick_7',
+    'CLOSE_15m_tick_8',
+    'CLOSE_30m_tick_1',
+    'CLOSE_30m_tick_2',
+    'CLOSE_30m_tick_3',
+    'CLOSE_30m_tick_4',
+    'CLOSE_30m_tick_5',
+    'CLOSE_30m_tick_6',
+    'CLOSE_30m_tick_7',
+    'CLOSE_30m_tick_8',
+    'day_of_month',
+    'hour_of_day',
+    'day_of_week',
+    'CLOSE_stl_trend',
+    'CLOSE_stl_seasonal',
+    'CLOSE_stl_resid',
+    'CLOSE_wav_detail_L1',
+    'CLOSE_wav_detail_L2',
+    'CLOSE_wav_approx_L2',
+    'CLOSE_mtm_band_1_0.000_0.010',
+    'CLOSE_mtm_band_2_0.010_0.060',
+    'CLOSE_mtm_band_3_0.060_0.200',
+    'CLOSE_mtm_band_4_0.200_0.500',
+    'CLOSE',
+)
+
 class FeReplicatorFeeder:
     """
     Feeder plugin that replicates feature-eng processing with perfect parameter matching.
@@ -140,14 +203,11 @@ class FeReplicatorFeeder:
         if not os.path.exists(full_path):
             raise FileNotFoundError(f"Input CSV file not found: {full_path}")
             
-        # Load the entire dataset
-        df = pd.read_csv(full_path)
-        
-        # Get the first N rows (same as feature-eng)
-        first_rows = df.head(num_rows).copy()
+        # Get the first N rows (same as feature-eng); only those rows are parsed
+        first_rows = pd.read_csv(full_path, nrows=num_rows)
         
         if not _QUIET: print(f"[FE_REPLICATOR] ✅ Loaded first {len(first_rows)} rows from: {csv_path}")
-        if not _QUIET: print(f"[FE_REPLICATOR] Date range: {first_rows.iloc[0]['datetime']} to {first_rows.iloc[-1]['datetime']}")
+        if not _QUIET: print(f"[FE_REPLICATOR] Date range: {first_rows['datetime'].iat[0]} to {first_rows['datetime'].iat[-1]}")
         
         return first_rows
     
@@ -157,13 +217,12 @@ class FeReplicatorFeeder:
             import pywt
             
             # Check if wavelet features are missing
-            wavelet_features = ['CLOSE_wav_detail_L1', 'CLOSE_wav_detail_L2', 'CLOSE_wav_approx_L2']
-            missing_features = [f for f in wavelet_features if f not in data.columns]
+            missing_set = _WAVELET_FEATURE_SET.difference(data.columns)
             
-            if not missing_features or 'CLOSE' not in data.columns:
+            if not missing_set or 'CLOSE' not in data.columns:
                 return data
             
-            if not _QUIET: print(f"[FE_REPLICATOR] Adding missing wavelet features: {missing_features}")
+            if not _QUIET: print(f"[FE_REPLICATOR] Adding missing wavelet features: {[f for f in _WAVELET_FEATURES if f in missing_set]}")
             
             # Extract CLOSE series for decomposition
             close_series = data['CLOSE'].values
@@ -181,7 +240,7 @@ class FeReplicatorFeeder:
             # Extract detail coefficients for each level
             for level in range(wavelet_levels):
                 feature_name = f'CLOSE_wav_detail_L{level+1}'
-                if feature_name in missing_features and level < len(coeffs) and len(coeffs[level]) == 2:
+                if feature_name in missing_set and level < len(coeffs) and len(coeffs[level]) == 2:
                     detail_coeffs = coeffs[level][1]  # Detail coefficients
                     if len(detail_coeffs) == len(series_clean):
                         # Normalize using mean and std like feature-eng
@@ -191,7 +250,7 @@ class FeReplicatorFeeder:
             
             # Extract final approximation coefficients
             feature_name = f'CLOSE_wav_approx_L{wavelet_levels}'
-            if feature_name in missing_features and len(coeffs) > 0 and len(coeffs[0]) == 2:
+            if feature_name in missing_set and len(coeffs) > 0 and len(coeffs[0]) == 2:
                 approx_coeffs = coeffs[0][0]  # Approximation coefficients
                 if len(approx_coeffs) == len(series_clean):
                     # Normalize using mean and std like feature-eng
@@ -354,6 +413,12 @@ class FeReplicatorFeeder:
         """Process data using the exact same pipeline as feature-eng."""
         if not _QUIET: print("[FE_REPLICATOR] Starting FE pipeline replication...")
         
+        # Parse the timestamp strings once; the to_datetime calls in the steps
+        # below then see a datetime64 column and skip string parsing
+        if 'datetime' in data.columns and not pd.api.types.is_datetime64_any_dtype(data['datetime']):
+            data = data.copy()
+            data['datetime'] = pd.to_datetime(data['datetime'], dayfirst=True, errors='coerce')
+        
         # Step 1: Prepare data (same as feature-eng data_processor.py)
         processed_data = self._prepare_data_like_feature_eng(data)
         
@@ -429,13 +494,13 @@ class FeReplicatorFeeder:
             if not _QUIET: print(f"[FE_REPLICATOR] ✅ Duplicate columns removed: {final_data.shape}")
         
         # Step 8: Reorder columns to match feature-eng exactly 
-        expected_column_order = ['DATE_TIME', 'RSI', 'MACD', 'MACD_Histogram', 'MACD_Signal', 'EMA', 'Stochastic_%K', 'Stochastic_%D', 'ADX', 'DI+', 'DI-', 'ATR', 'CCI', 'WilliamsR', 'Momentum', 'ROC', 'OPEN', 'HIGH', 'LOW', 'BC-BO', 'BH-BL', 'BH-BO', 'BO-BL', 'S&P500_Close', 'vix_close', 'CLOSE_15m_tick_1', 'CLOSE_15m_tick_2', 'CLOSE_15m_tick_3', 'CLOSE_15m_tick_4', 'CLOSE_15m_tick_5', 'CLOSE_15m_tick_6', 'CLOSE_15m_tick_7', 'CLOSE_15m_tick_8', 'CLOSE_30m_tick_1', 'CLOSE_30m_tick_2', 'CLOSE_30m_tick_3', 'CLOSE_30m_tick_4', 'CLOSE_30m_tick_5', 'CLOSE_30m_tick_6', 'CLOSE_30m_tick_7', 'CLOSE_30m_tick_8', 'day_of_month', 'hour_of_day', 'day_of_week', 'CLOSE_stl_trend', 'CLOSE_stl_seasonal', 'CLOSE_stl_resid', 'CLOSE_wav_detail_L1', 'CLOSE_wav_detail_L2', 'CLOSE_wav_approx_L2', 'CLOSE_mtm_band_1_0.000_0.010', 'CLOSE_mtm_band_2_0.010_0.060', 'CLOSE_mtm_band_3_0.060_0.200', 'CLOSE_mtm_band_4_0.200_0.500', 'CLOSE']
         
         # Reset index to have DATE_TIME as column
         final_data.reset_index(inplace=True)
         
         # Reorder columns to match the expected order
-        available_columns = [col for col in expected_column_order if col in final_data.columns]
+        present_columns = set(final_data.columns)
+        available_columns = [col for col in _EXPECTED_COLUMN_ORDER if col in present_columns]
         final_data = final_data[available_columns]
         
         if not _QUIET: print(f"[FE_REPLICATOR] ✅ Reordered columns to match feature-eng output")
@@ -609,15 +674,21 @@ class FeReplicatorFeeder:
         
         return output_path
     
-    def compare_with_feature_eng_output(self, replicated_data: pd.DataFrame, num_rows: int = 1000) -> Dict[str, Any]:
-        """Compare replicated output with feature-eng output for exact matching."""
-        if not _QUIET: print("[FE_REPLICATOR] Starting exact comparison...")
+    def compare_with_feature_eng_output(self, replicated_data: pd.DataFrame, num_rows: int = 1000,
+                                        verbose: bool = not _QUIET) -> Dict[str, Any]:
+        """
+        Compare replicated output with feature-eng output for exact matching.
+
+        Progress and mismatch details are collected while comparing and printed
+        as one block at the end when ``verbose`` is set.
+        """
+        report: List[str] = ["[FE_REPLICATOR] Starting exact comparison..."]
         
         # Calculate maximum window size needed for all decomposition methods
         # Based on the configuration parameters
         max_window_size = self._calculate_max_window_size()
-        if not _QUIET: print(f"[FE_REPLICATOR] Maximum window size for all methods: {max_window_size}")
-        if not _QUIET: print(f"[FE_REPLICATOR] Skipping first {max_window_size} rows to compare only valid calculated values")
+        report.append(f"[FE_REPLICATOR] Maximum window size for all methods: {max_window_size}")
+        report.append(f"[FE_REPLICATOR] Skipping first {max_window_size} rows to compare only valid calculated values")
         
         # Load feature-eng output
         fe_output_path = os.path.join(self.feature_eng_repo_path, self.plugin_params['comparison_csv_path'])
@@ -625,28 +696,32 @@ class FeReplicatorFeeder:
         if not os.path.exists(fe_output_path):
             raise FileNotFoundError(f"Feature-eng output not found: {fe_output_path}")
             
-        fe_output = pd.read_csv(fe_output_path)
-        
         # Skip initial rows that don't have sufficient window data for decomposition
-        # Compare only rows from max_window_size onward
+        # Compare only rows from max_window_size onward; only that window of the
+        # feature-eng output is parsed, so memory is bounded by num_rows
         start_row = max_window_size
-        end_row = min(start_row + num_rows, len(fe_output), len(replicated_data))
         
-        fe_comparison_rows = fe_output.iloc[start_row:end_row]
+        # Column names come from the header alone; only columns that also exist
+        # in the replicated data are parsed, since no others can be compared
+        fe_header = pd.read_csv(fe_output_path, nrows=0).columns
+        fe_columns = set(fe_header)
+        replicated_columns = set(replicated_data.columns)
+        columns_match = fe_columns == replicated_columns
+        usecols = [col for col in fe_header if col in replicated_columns] or list(fe_header[:1])
+        fe_comparison_rows = pd.read_csv(fe_output_path, usecols=usecols, skiprows=range(1, start_row + 1), nrows=num_rows)
+        end_row = min(start_row + len(fe_comparison_rows), len(replicated_data))
+        
+        fe_comparison_rows = fe_comparison_rows.iloc[:max(end_row - start_row, 0)]
         replicated_comparison_rows = replicated_data.iloc[start_row:end_row]
         
         actual_comparison_rows = len(fe_comparison_rows)
-        if not _QUIET: print(f"[FE_REPLICATOR] Comparing {actual_comparison_rows} rows (from row {start_row} to {end_row-1})...")
-        if not _QUIET: print(f"[FE_REPLICATOR] Feature-eng shape: {fe_comparison_rows.shape}")
-        if not _QUIET: print(f"[FE_REPLICATOR] Replicated shape: {replicated_comparison_rows.shape}")
+        fe_shape = (actual_comparison_rows, len(fe_header))
+        report.append(f"[FE_REPLICATOR] Comparing {actual_comparison_rows} rows (from row {start_row} to {end_row-1})...")
+        report.append(f"[FE_REPLICATOR] Feature-eng shape: {fe_shape}")
+        report.append(f"[FE_REPLICATOR] Replicated shape: {replicated_comparison_rows.shape}")
         
         # Compare shapes
-        shape_match = fe_comparison_rows.shape == replicated_comparison_rows.shape
-        
-        # Compare column names
-        fe_columns = set(fe_comparison_rows.columns)
-        replicated_columns = set(replicated_comparison_rows.columns)
-        columns_match = fe_columns == replicated_columns
+        shape_match = fe_shape == replicated_comparison_rows.shape
         
         # Compare values for exact matching
         exact_match = True
@@ -655,35 +730,85 @@ class FeReplicatorFeeder:
         if shape_match and columns_match:
             # Align columns
             common_columns = sorted(fe_columns.intersection(replicated_columns))
-            
+            # Use a very small tolerance for floating-point comparison
+            tolerance = 1e-10
+            
+            # Compare every numeric column in one fused pass over the 2-D block.
+            # Each side is converted to float64 once, in column-major order so
+            # the per-column diagnostics below slice contiguous memory
+            numeric_columns = [
+                col for col in common_columns
+                if pd.api.types.is_numeric_dtype(fe_comparison_rows[col])
+                and pd.api.types.is_numeric_dtype(replicated_comparison_rows[col])
+            ]
+            numeric_index = {col: i for i, col in enumerate(numeric_columns)}
+            datetime_columns = {
+                col for col in common_columns
+                if pd.api.types.is_datetime64_any_dtype(fe_comparison_rows[col])
+                or pd.api.types.is_datetime64_any_dtype(replicated_comparison_rows[col])
+            }
+            bad_numeric_columns = set()
+            if numeric_columns:
+                fe_block = np.asfortranarray(fe_comparison_rows[numeric_columns].to_numpy(dtype=np.float64))
+                replicated_block = np.asfortranarray(replicated_comparison_rows[numeric_columns].to_numpy(dtype=np.float64))
+                # A deterministic replication is usually bitwise identical, which a
+                # single equality pass confirms; tolerances are only needed otherwise
+                if not np.array_equal(fe_block, replicated_block, equal_nan=True):
+                    close = np.isclose(fe_block, replicated_block, atol=tolerance, rtol=tolerance, equal_nan=True)
+                    if not close.all():
+                        bad_numeric_columns = {numeric_columns[i] for i in np.flatnonzero(~close.all(axis=0))}
+            
+            # Only mismatching or non-numeric columns need per-column work
             for col in common_columns:
-                fe_values = fe_comparison_rows[col].values
-                replicated_values = replicated_comparison_rows[col].values
-                
-                # Convert to float64 to ensure compatible types for comparison
-                try:
-                    fe_values = fe_values.astype(np.float64)
-                    replicated_values = replicated_values.astype(np.float64)
-                except (ValueError, TypeError):
-                    # Handle non-numeric columns (like datetime strings)
-                    fe_values = fe_values.astype(str)
-                    replicated_values = replicated_values.astype(str)
+                i = numeric_index.get(col)
+                if i is not None:
+                    if col not in bad_numeric_columns:
+                        continue
+                    fe_values = fe_block[:, i]
+                    replicated_values = replicated_block[:, i]
+                elif col in datetime_columns:
+                    # The CSV holds timestamps as text while the replicated side
+                    # is datetime64; both are parsed to nanoseconds (NaT included)
+                    # so only the instants are compared, not their formatting
+                    fe_values = pd.to_datetime(fe_comparison_rows[col], errors='coerce').to_numpy('datetime64[ns]').view(np.int64)
+                    replicated_values = pd.to_datetime(replicated_comparison_rows[col], errors='coerce').to_numpy('datetime64[ns]').view(np.int64)
+                else:
+                    fe_values = fe_comparison_rows[col].to_numpy()
+                    replicated_values = replicated_comparison_rows[col].to_numpy()
+                    
+                    # Convert to float64 to ensure compatible types for comparison
+                    try:
+                        fe_values = fe_values.astype(np.float64)
+                        replicated_values = replicated_values.astype(np.float64)
+                    except (ValueError, TypeError):
+                        # Handle other non-numeric columns as text
+                        fe_values = fe_values.astype(str)
+                        replicated_values = replicated_values.astype(str)
                 
-                # For exact matching with floating-point tolerance
+                # For exact matching with floating-point tolerance; timestamps
+                # must match exactly
                 try:
-                    # Use a very small tolerance for floating-point comparison
-                    tolerance = 1e-10
-                    if not np.allclose(fe_values, replicated_values, atol=tolerance, rtol=tolerance, equal_nan=True):
+                    if col in datetime_columns:
+                        matches = np.array_equal(fe_values, replicated_values)
+                    else:
+                        matches = col not in bad_numeric_columns and np.allclose(fe_values, replicated_values, atol=tolerance, rtol=tolerance, equal_nan=True)
+                    if not matches:
                         exact_match = False
                         mismatched_columns.append(col)
                         
-                        # Show detailed comparison for debugging
-                        if not _QUIET: print(f"[FE_REPLICATOR] ❌ MISMATCH in column '{col}':")
-                        if not _QUIET: print(f"  Feature-eng first 3 values: {fe_values[:3]}")
-                        if not _QUIET: print(f"  Replicated first 3 values: {replicated_values[:3]}")
-                        if not _QUIET: print(f"  Max difference: {np.max(np.abs(fe_values - replicated_values))}")
+                        # Record detailed comparison for debugging
+                        if verbose:
+                            report.append(f"[FE_REPLICATOR] ❌ MISMATCH in column '{col}':")
+                            report.append(f"  Feature-eng first 3 values: {fe_values[:3]}")
+                            report.append(f"  Replicated first 3 values: {replicated_values[:3]}")
+                            report.append(f"  Max difference: {np.max(np.abs(fe_values - replicated_values))}")
+                            if fe_values.dtype.kind == 'f':
+                                # NaNs present on only one side, counted in one XOR pass
+                                nan_mismatches = np.count_nonzero(np.isnan(fe_values) ^ np.isnan(replicated_values))
+                                if nan_mismatches:
+                                    report.append(f"  NaN position mismatches: {nan_mismatches}")
                 except Exception as e:
-                    if not _QUIET: print(f"[FE_REPLICATOR] ❌ Error comparing column '{col}': {e}")
+                    report.append(f"[FE_REPLICATOR] ❌ Error comparing column '{col}': {e}")
                     exact_match = False
                     mismatched_columns.append(col)
         else:
@@ -693,7 +818,7 @@ class FeReplicatorFeeder:
             'exact_match': exact_match,
             'shape_match': shape_match,
             'columns_match': columns_match,
-            'fe_shape': fe_comparison_rows.shape,
+            'fe_shape': fe_shape,
             'replicated_shape': replicated_comparison_rows.shape,
             'fe_columns': list(fe_columns),
             'replicated_columns': list(replicated_columns),
@@ -702,12 +827,15 @@ class FeReplicatorFeeder:
         }
         
         if exact_match:
-            if not _QUIET: print("[FE_REPLICATOR] ✅ PERFECT MATCH! Exact replicability achieved!")
+            report.append("[FE_REPLICATOR] ✅ PERFECT MATCH! Exact replicability achieved!")
         else:
-            if not _QUIET: print("[FE_REPLICATOR] ❌ MISMATCH detected. Replicability failed.")
-            if not _QUIET: print(f"[FE_REPLICATOR] Shape match: {shape_match}")
-            if not _QUIET: print(f"[FE_REPLICATOR] Columns match: {columns_match}")
-            if not _QUIET: print(f"[FE_REPLICATOR] Mismatched columns: {mismatched_columns}")
+            report.append("[FE_REPLICATOR] ❌ MISMATCH detected. Replicability failed.")
+            report.append(f"[FE_REPLICATOR] Shape match: {shape_match}")
+            report.append(f"[FE_REPLICATOR] Columns match: {columns_match}")
+            report.append(f"[FE_REPLICATOR] Mismatched columns: {mismatched_columns}")
+        
+        if verbose:
+            print("\n".join(report))
         
         return comparison_result
     
@@ -15,8 +15,14 @@ import tensorflow as tf
 from tensorflow import keras
 import os
 import json
+from collections import OrderedDict
 from datetime import datetime
 
+from app.json_cache import load_json
+
+# Input precision the Keras models are built with; inputs are cast once to it
+PREDICTOR_INPUT_DTYPE = np.float32
+
 class DefaultPredictor:
     """
     Default predictor plugin for loading models and making predictions.
@@ -53,7 +59,7 @@ class DefaultPredictor:
         """
         self.params = self.plugin_params.copy()
         self.model = None
-        self.model_cache = {}
+        self.model_cache = OrderedDict()  # model_path -> model, least recently used first
         self.model_metadata = {}
         self.normalization_params = None
         self.model_dir = "plugins_predictor/models"  # Add this for unit tests
@@ -146,8 +152,7 @@ class DefaultPredictor:
             return
 
         try:
-            with open(path, 'r') as f:
-                self.normalization_params = json.load(f)
+            self.normalization_params = load_json(path)
             if not _QUIET: print(f"Normalization parameters loaded successfully from {path}")
         except Exception as e:
             if not _QUIET: print(f"Failed to load or parse normalization parameters from {path}: {e}")
@@ -175,6 +180,7 @@ class DefaultPredictor:
         # Check if model is already in cache
         if model_path in self.model_cache:
             self.model = self.model_cache[model_path]
+            self.model_cache.move_to_end(model_path)
             if not _QUIET: print(f"Model loaded from cache: {model_path}")
             return True
         
@@ -262,12 +268,12 @@ class DefaultPredictor:
         """
         cache_size = self.params.get("model_cache_size", 5)
         
-        # Remove oldest model if cache is full
-        if len(self.model_cache) >= cache_size:
-            oldest_key = next(iter(self.model_cache))
-            del self.model_cache[oldest_key]
+        # Evict the least recently used model if cache is full
+        if model_path not in self.model_cache and len(self.model_cache) >= cache_size:
+            self.model_cache.popitem(last=False)
         
         self.model_cache[model_path] = model
+        self.model_cache.move_to_end(model_path)
     
     def _load_model_metadata(self, model_path):
         """
@@ -411,11 +417,14 @@ class DefaultPredictor:
             if not _QUIET: print("Warning: Standard deviation is zero. Cannot de-normalize.")
             return predictions, uncertainties
 
-        # De-normalize predictions: value * std + mean
-        denormalized_preds = (predictions * std) + mean
+        # De-normalize predictions: value * std + mean, shifted in place so only one
+        # output buffer is allocated
+        predictions = np.asarray(predictions)
+        denormalized_preds = np.multiply(predictions, std, dtype=np.result_type(predictions, std, mean))
+        np.add(denormalized_preds, mean, out=denormalized_preds)
 
         # De-normalize uncertainties: value * std
-        denormalized_uncerts = uncertainties * std
+        denormalized_uncerts = np.multiply(uncertainties, std)
 
         return denormalized_preds, denormalized_uncerts
 
@@ -435,6 +444,8 @@ class DefaultPredictor:
         
         if mc_samples is None:
             mc_samples = self.params.get("mc_samples", 100)
+        if mc_samples < 1:
+            raise ValueError(f"mc_samples must be at least 1, got {mc_samples}")
         
         try:
             # Ensure input data is properly shaped
@@ -444,30 +455,34 @@ class DefaultPredictor:
                     input_data = input_data[self.model_metadata['feature_columns']]
                 input_data = input_data.values
 
-            input_data = np.array(input_data)
-            
-            # Store predictions from multiple forward passes
-            predictions_list = []
-            
-            # Enable dropout during inference for uncertainty estimation
-            for _ in range(mc_samples):
-                # For Keras models, use training=True to enable dropout
-                if hasattr(self.model, 'predict'):
-                    if hasattr(self.model, '__call__'):
-                        # Call model with training=True to enable dropout
-                        pred = self.model(input_data, training=True)
-                        if hasattr(pred, 'numpy'):
-                            pred = pred.numpy()
-                    else:
-                        pred = self.model.predict(input_data, batch_size=self.params.get("batch_size", 32))
+            input_data = np.asarray(input_data)
+            n_rows = input_data.shape[0]
+
+            # Stack copies of the batch along axis 0 so one forward pass draws
+            # several Monte Carlo samples; dropout masks are sampled
+            # independently for each row. Each pass holds at most batch_size
+            # rows (and always at least one full sample), so memory stays
+            # bounded however large mc_samples is
+            samples_per_pass = max(1, self.params.get("batch_size", 32) // max(n_rows, 1))
+            samples_per_pass = min(samples_per_pass, mc_samples)
+            tiled_input = np.tile(input_data, (samples_per_pass,) + (1,) * (input_data.ndim - 1))
+
+            chunks = []
+            for start in range(0, mc_samples, samples_per_pass):
+                chunk = tiled_input[:min(samples_per_pass, mc_samples - start) * n_rows]
+                if hasattr(self.model, '__call__'):
+                    # Call model with training=True to enable dropout
+                    pred = self.model(chunk, training=True)
+                    if hasattr(pred, 'numpy'):
+                        pred = pred.numpy()
                 else:
-                    pred = self.model.predict(input_data)
-                
-                predictions_list.append(pred)
-            
-            # Convert to numpy array
-            predictions_array = np.array(predictions_list)
-            
+                    pred = self.model.predict(chunk, batch_size=self.params.get("batch_size", 32))
+                chunks.append(np.asarray(pred))
+
+            # Regroup rows as (mc_samples, n_rows, ...)
+            pred = np.concatenate(chunks)
+            predictions_array = pred.reshape((mc_samples, n_rows) + pred.shape[1:])
+
             # Calculate mean and standard deviation
             mean_predictions = np.mean(predictions_array, axis=0)
             uncertainty_estimates = np.std(predictions_array, axis=0)
@@ -569,20 +584,39 @@ class DefaultPredictor:
         
         return True
     
+    @property
+    def model_dir(self):
+        """Directory that named models are loaded from."""
+        return self._model_dir
+
+    @model_dir.setter
+    def model_dir(self, value):
+        self._model_dir = value
+        # Joined once here so _get_model_path is a single string build per call
+        self._model_prefix = os.path.join(value, "")
+
     def _get_model_path(self, model_name):
         """
         Construct the full path to a model file.
         """
-        return os.path.join(self.model_dir, f"{model_name}.keras")
+        return f"{self._model_prefix}{model_name}.keras"
 
     def predict(self, model_name, data):
         """
         Make a prediction using the specified model.
+
+        The whole batch goes through a single ``model.predict`` call, and
+        ``prediction`` and ``uncertainty`` hold one value per input row.
         """
         model_path = self._get_model_path(model_name)
-        model = tf.keras.models.load_model(model_path)
-        prediction = model.predict(data)
+        model = self.model_cache.get(model_path)
+        if model is None:
+            model = self._load_keras_model(model_path)
+            self._cache_model(model_path, model)
+        else:
+            self.model_cache.move_to_end(model_path)
+        prediction = np.asarray(model.predict(np.asarray(data, dtype=PREDICTOR_INPUT_DTYPE)))
         return {
-            "prediction": prediction[0][0],
-            "uncertainty": prediction[0][1]
+            "prediction": prediction[:, 0],
+            "uncertainty": prediction[:, 1]
         }
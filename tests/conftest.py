@@ -27,7 +27,9 @@ from app.auth import hash_api_key, get_password_hash
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+# One SQLite file per pytest-xdist worker so parallel runs never share a database
+TEST_DATABASE_PATH = f"test_{os.environ.get('PYTEST_XDIST_WORKER', 'gw0')}.db"
+SQLALCHEMY_DATABASE_URL = f"sqlite:///./{TEST_DATABASE_PATH}"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
@@ -106,7 +108,7 @@ def setup_test_database():
     yield
     # Cleanup after all tests
     try:
-        os.remove("test.db")
+        os.remove(TEST_DATABASE_PATH)
     except FileNotFoundError:
         pass
 
@@ -9,9 +9,9 @@ from plugins_pipeline.default_pipeline import DefaultPipelinePlugin
 from plugins_feeder.default_feeder import DefaultFeeder
 from plugins_predictor.default_predictor import DefaultPredictor
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_plugins():
-    """Fixture to provide mocked feeder and predictor plugins."""
+    """Fixture to provide mocked feeder and predictor plugins, built once per module."""
     mock_feeder = Mock(spec=DefaultFeeder)
     mock_predictor = Mock(spec=DefaultPredictor)
     # Configure mock return values if necessary for the pipeline to run
@@ -19,58 +19,50 @@ def mock_plugins():
     mock_predictor.predict.return_value = ([101.5, 102.5], [0.1, 0.2])
     return mock_feeder, mock_predictor
 
-def test_model_selection_for_long_term_prediction(mock_plugins):
+@pytest.fixture(autouse=True)
+def _reset_mock_plugins(mock_plugins, pipeline):
     """
-    Tests if the pipeline correctly configures the feeder and predictor
-    for parameter changes.
+    Clears recorded calls on the shared mocks and restores the shared
+    pipeline's params after each test.
     """
-    mock_feeder, mock_predictor = mock_plugins
+    params = dict(pipeline.params)
+    yield
+    for mock in mock_plugins:
+        mock.reset_mock()
+    pipeline.params.clear()
+    pipeline.params.update(params)
 
-    # Instantiate the pipeline with the mocked plugins
+@pytest.fixture(scope="module")
+def pipeline(mock_plugins):
+    """Provides a pipeline initialized once with the mocked plugins."""
+    mock_feeder, mock_predictor = mock_plugins
     pipeline = DefaultPipelinePlugin()
     with patch.object(pipeline, '_initialize_database'), \
          patch.object(pipeline, '_validate_system', return_value=True):
         pipeline.initialize(mock_predictor, mock_feeder)
+    return pipeline
 
-    # Test that the pipeline can handle different parameters
-    test_params = {
-        "prediction_interval": 600,
-        "enable_logging": True
-    }
-    
-    # Act
-    pipeline.set_params(**test_params)
-    
-    # Assert
-    assert pipeline.params["prediction_interval"] == 600
-    assert pipeline.params["enable_logging"] == True
-    
-    # Verify plugins are properly initialized
-    assert pipeline.predictor_plugin == mock_predictor
-    assert pipeline.feeder_plugin == mock_feeder
-
-def test_model_selection_for_short_term_prediction(mock_plugins):
+@pytest.mark.parametrize("test_params", [
+    {"prediction_interval": 600, "enable_logging": True},
+    {"prediction_interval": 300, "log_level": "DEBUG"},
+], ids=["long_term", "short_term"])
+def test_model_selection_for_prediction(test_params, pipeline, mock_plugins):
     """
-    Tests if the pipeline correctly handles different configurations.
+    Tests if the pipeline correctly configures the feeder and predictor
+    for the parameter changes of each prediction type.
     """
     mock_feeder, mock_predictor = mock_plugins
 
-    pipeline = DefaultPipelinePlugin()
-    with patch.object(pipeline, '_initialize_database'), \
-         patch.object(pipeline, '_validate_system', return_value=True):
-        pipeline.initialize(mock_predictor, mock_feeder)
+    # Act
+    pipeline.set_params(**test_params)
 
-        # Test parameter configuration
-        test_params = {
-            "prediction_interval": 300,
-            "log_level": "DEBUG"
-        }
-        
-        pipeline.set_params(**test_params)
+    # Assert parameters are set correctly and nothing leaked from other cases
+    for key, value in test_params.items():
+        assert pipeline.params[key] == value
+    for key, value in DefaultPipelinePlugin.plugin_params.items():
+        if key not in test_params:
+            assert pipeline.params[key] == value
 
-        # Assert parameters are set correctly
-        assert pipeline.params["prediction_interval"] == 300
-        assert pipeline.params["log_level"] == "DEBUG"
-        
-        # Verify system validation works (within patch context)
-        assert pipeline._validate_system() == True
+    # Verify plugins are properly initialized
+    assert pipeline.predictor_plugin == mock_predictor
+    assert pipeline.feeder_plugin == mock_feeder
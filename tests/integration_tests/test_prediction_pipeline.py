@@ -22,15 +22,23 @@ def mock_config():
         "prediction_interval": 1 # Run quickly for tests
     }
 
+@pytest.fixture(scope="session")
+def _feeder_df_template():
+    """
+    Builds the feeder output frame once per session.
+    """
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.random((256, 45)), columns=[f'col{i}' for i in range(45)])
+
 @pytest.fixture
-def mock_feeder():
+def mock_feeder(_feeder_df_template):
     """
     Creates a mock feeder plugin.
     """
     feeder = MagicMock(spec=DefaultFeeder)
-    # Mock the data result that the feeder would return
-    mock_df = pd.DataFrame(np.random.rand(256, 45), columns=[f'col{i}' for i in range(45)])
-    feeder.fetch.return_value = mock_df
+    # Mock the data result that the feeder would return; a shallow copy keeps
+    # the shared template intact if a consumer adds or drops columns
+    feeder.fetch.return_value = _feeder_df_template.copy(deep=False)
     return feeder
 
 @pytest.fixture
@@ -4,7 +4,6 @@ from fastapi.testclient import TestClient
 from plugins_core.default_core import app
 from sqlalchemy import text
 import json
-import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 @pytest.fixture
@@ -259,12 +258,14 @@ class TestSecurityVulnerabilities:
         # Either all should succeed (no rate limiting implemented) or some should be rate limited
         assert success_count + rate_limited_count == 20, "All requests should either succeed or be rate limited"
         
-        # If rate limiting is implemented, verify it works
+        # The predictions endpoint never writes rate_limit_store, so no 429 is
+        # returned and this branch does not run today. If limiting is added,
+        # this only checks that clearing the store lets requests through; it
+        # is not a window-expiry check
         if rate_limited_count > 0:
-            # Wait and verify rate limit resets
-            time.sleep(2)
+            security_client.post("/test/reset-rate-limit")
             recovery_response = security_client.post("/api/v1/predictions/", json=payload, headers=headers)
-            assert recovery_response.status_code == 201, "Rate limit should reset after waiting"
+            assert recovery_response.status_code == 201, "Requests should succeed once the rate-limit store is cleared"
     
     def test_concurrent_access_security(self, security_client):
         """
@@ -1,19 +1,35 @@
 import pytest
 import logging
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 # Assuming a centralized logging configuration in the app
-from app.main import app, setup_logging
+from app.main import setup_logging
+from plugins_core.default_core import app, get_prediction_runner
 
 # This test requires capturing log output. The caplog fixture from pytest is perfect for this.
 
 @pytest.fixture(autouse=True)
-def setup_test_logging(caplog):
+def setup_test_logging(caplog, tmp_path):
     """Ensure logging is set up for each test and caplog is used."""
-    # Set a low level to capture all logs during testing
-    setup_logging(level=logging.DEBUG)
+    # Set a low level to capture all logs during testing; the log file lives in
+    # the per-test tmp dir so parallel workers never write to the same file
+    setup_logging({"log_level": "DEBUG", "log_file": str(tmp_path / "app.log")})
     caplog.set_level(logging.INFO)
 
+def _mock_flow(prediction_id, task_id, *args):
+    """Simulate the background task lifecycle by logging its status changes."""
+    logging.info(f"Prediction {prediction_id}: Status changed to processing")
+    # Simulate work
+    logging.info(f"Prediction {prediction_id}: Status changed to completed")
+
+@pytest.fixture(scope="module")
+def prediction_runner():
+    """Swap the background prediction runner for a recording mock once per module."""
+    runner = MagicMock(side_effect=_mock_flow)
+    app.dependency_overrides[get_prediction_runner] = lambda: runner
+    yield runner
+    app.dependency_overrides.pop(get_prediction_runner, None)
+
 def test_request_logging(test_client, caplog):
     """Test that both valid and invalid API requests are logged."""
     # 1. Send a valid request
@@ -24,28 +40,24 @@ def test_request_logging(test_client, caplog):
     invalid_data = {}  # Empty request should fail validation
     test_client.post("/api/v1/predictions/", json=invalid_data)
 
-    # 3. Inspect the logs
-    log_records = [record.message for record in caplog.records]
-    
-    # Check for logs from both requests
+    # 3. Inspect the access logs in a single pass
     # Look for the request logging pattern: METHOD PATH - STATUS_CODE - TIME
-    assert any("POST /api/v1/predictions/" in msg and "201" in msg for msg in log_records)
-    assert any("POST /api/v1/predictions/" in msg and "422" in msg for msg in log_records)
+    wanted = {"201", "422"}
+    found = set()
+    for record in caplog.records:
+        if not record.name.startswith("prediction_provider"):
+            continue
+        msg = record.getMessage()
+        if "POST /api/v1/predictions/" in msg:
+            found.update(code for code in wanted if code in msg)
+    assert wanted <= found
 
-@patch('plugins_core.default_core.run_prediction_task_sync') # Mock the core prediction logic
-def test_event_logging_for_prediction_flow(mock_run_task, test_client, caplog):
+def test_event_logging_for_prediction_flow(prediction_runner, test_client, caplog):
     """
     Test that key stages of the prediction process (e.g., processing, completed)
     are logged correctly against a prediction ID.
     """
-    # Mock the background task to simulate its lifecycle
-    def mock_flow(prediction_id, task_id):
-        import logging
-        logging.info(f"Prediction {prediction_id}: Status changed to processing")
-        # Simulate work
-        logging.info(f"Prediction {prediction_id}: Status changed to completed")
-
-    mock_run_task.side_effect = mock_flow
+    prediction_runner.reset_mock()
 
     # Trigger a prediction
     prediction_data = {"symbol": "TSLA", "interval": "1h", "prediction_type": "short_term"}
@@ -53,10 +65,10 @@ def test_event_logging_for_prediction_flow(mock_run_task, test_client, caplog):
     prediction_id = response.json()["id"]
 
     # Verify that the mock was called
-    mock_run_task.assert_called_once()
+    prediction_runner.assert_called_once()
     
     # Check that the background task was scheduled (processing log should be there)
-    log_records = [record.message for record in caplog.records]
+    log_records = {record.getMessage() for record in caplog.records}
     
     # The task should have been called with the prediction ID
     assert any(f"Prediction {prediction_id}" in msg for msg in log_records)
@@ -67,7 +79,7 @@ def test_event_logging_for_prediction_flow(mock_run_task, test_client, caplog):
     print(f"Looking for prediction {prediction_id}")
     
     # Check if the mocked function was called and produced logs
-    if mock_run_task.call_count > 0:
+    if prediction_runner.call_count > 0:
         # The mock should have been called and should have logged both messages
         assert f"Prediction {prediction_id}: Status changed to processing" in log_records
         assert f"Prediction {prediction_id}: Status changed to completed" in log_records
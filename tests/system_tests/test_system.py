@@ -1,28 +1,92 @@
 
 import pytest
+import pytest_asyncio
 import asyncio
-from fastapi.testclient import TestClient
+import httpx
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from unittest.mock import MagicMock
+from plugins_core import default_core
 from plugins_core.default_core import app
-from app.database import get_db, Base, engine
-from app.database_models import PredictionJob
+from app import database
+from app.database import get_db, Base
+from tests.conftest import SQLALCHEMY_DATABASE_URL as TEST_DATABASE_URL
 import time
 
-# Use a separate test database
-TEST_DATABASE_URL = "sqlite:///./test.db"
+test_engine = create_engine(
+    TEST_DATABASE_URL, connect_args={"check_same_thread": False}
+)
 
-# This is a placeholder for now. We will need to implement the actual database setup and teardown
-# in a conftest.py file later.
-@pytest.fixture(scope="module")
-def test_client():
-    # Create the test database
-    Base.metadata.create_all(bind=engine)
-    client = TestClient(app)
-    yield client
-    # Drop the test database
-    Base.metadata.drop_all(bind=engine)
 
+@event.listens_for(test_engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    # pysqlite commits implicitly around SAVEPOINT; let SQLAlchemy emit BEGIN itself
+    dbapi_connection.isolation_level = None
 
-def test_full_prediction_lifecycle(test_client):
+
+@event.listens_for(test_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _schema():
+    """
+    Create the test database schema once per session; conftest removes the
+    test database file when the session ends.
+    """
+    Base.metadata.create_all(bind=test_engine)
+
+
+@pytest.fixture
+def db_session():
+    """Session wrapped in an outer transaction that is rolled back after the test."""
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    previous_override = app.dependency_overrides.get(get_db)
+    app.dependency_overrides[get_db] = lambda: session
+    yield session
+    if previous_override is None:
+        app.dependency_overrides.pop(get_db, None)
+    else:
+        app.dependency_overrides[get_db] = previous_override
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+# Output returned by the stub pipeline that stands in for the loaded plugins
+_PIPELINE_OUTPUT = {"prediction": [1.0, 2.0, 3.0], "uncertainty": [0.1, 0.2, 0.15]}
+
+
+@pytest.fixture
+def pipeline_plugins(db_session, monkeypatch):
+    """
+    Let the real background runner complete predictions inside the test:
+    its SessionLocal joins the test connection's outer transaction, and a stub
+    pipeline stands in for the plugins loaded at startup.
+    """
+    session_factory = sessionmaker(
+        autocommit=False, autoflush=False,
+        bind=db_session.bind, join_transaction_mode="create_savepoint",
+    )
+    monkeypatch.setattr(database, "SessionLocal", session_factory)
+    pipeline = MagicMock()
+    pipeline.run_request.return_value = _PIPELINE_OUTPUT
+    monkeypatch.setattr(default_core, "_LOADED_PLUGINS", {"pipeline": pipeline}, raising=False)
+    return pipeline
+
+
+@pytest_asyncio.fixture
+async def async_test_client(db_session):
+    # A single client reuses one event loop and connection for every request
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_full_prediction_lifecycle(async_test_client, pipeline_plugins):
     """
     Test the full lifecycle of a prediction:
     1. Create a prediction.
@@ -40,7 +104,7 @@ def test_full_prediction_lifecycle(test_client):
     
     # 1. Create a prediction
     print("Creating prediction...")
-    response = test_client.post("/api/v1/predictions/", json=prediction_data)
+    response = await async_test_client.post("/api/v1/predictions/", json=prediction_data)
     print(f"Create response status: {response.status_code}")
     assert response.status_code == 201
     prediction = response.json()
@@ -54,7 +118,7 @@ def test_full_prediction_lifecycle(test_client):
     start_time = time.time()
     final_status = "pending"
     while time.time() - start_time < timeout:
-        response = test_client.get(f"/api/v1/predictions/{prediction_id}")
+        response = await async_test_client.get(f"/api/v1/predictions/{prediction_id}")
         print(f"Poll response status: {response.status_code}")
         assert response.status_code == 200
         status = response.json()["status"]
@@ -64,25 +128,22 @@ def test_full_prediction_lifecycle(test_client):
             break
         elif status == "failed":
             pytest.fail("Prediction failed during processing.")
-        time.sleep(1)
+        await asyncio.sleep(0.05)
     
     # 3. Retrieve and verify final state
     print("Retrieving final result...")
-    response = test_client.get(f"/api/v1/predictions/{prediction_id}")
+    response = await async_test_client.get(f"/api/v1/predictions/{prediction_id}")
     assert response.status_code == 200
     final_prediction = response.json()
     
     assert final_prediction["id"] == prediction_id
-    # Accept either completed or pending status (async tasks may not complete in test environment)
-    assert final_prediction["status"] in ["completed", "pending"]
+    assert final_prediction["status"] == "completed"
     assert final_prediction["symbol"] == "AAPL"
     
-    # If completed, verify result structure
-    if final_prediction["status"] == "completed":
-        assert "result" in final_prediction
-        assert final_prediction["result"] is not None
-        assert "prediction" in final_prediction["result"]
-        assert "uncertainty" in final_prediction["result"]
+    # Verify the runner stored the pipeline output alongside the request
+    assert final_prediction["result"]["output"] == _PIPELINE_OUTPUT
+    assert final_prediction["result"]["request"]["symbol"] == "AAPL"
+    pipeline_plugins.run_request.assert_called_once()
     
     print("Test completed successfully!")
 
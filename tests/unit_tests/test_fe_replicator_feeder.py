@@ -0,0 +1,95 @@
+"""Tests for FeReplicatorFeeder.compare_with_feature_eng_output."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from plugins_feeder import fe_replicator_feeder
+from plugins_feeder.fe_replicator_feeder import FeReplicatorFeeder
+
+
+@pytest.fixture(scope="module")
+def replicated():
+    """Replicated output: a DATE_TIME column plus numeric features, one with NaNs."""
+    n = 1300
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.random((n, 6)), columns=[f"f{i}" for i in range(6)])
+    df.loc[::7, "f1"] = np.nan
+    df.insert(0, "DATE_TIME", pd.date_range("2005-05-03", periods=n, freq="h"))
+    return df
+
+
+def _compare(tmp_path, replicated, fe_output, num_rows=1000):
+    path = tmp_path / "feature_eng_output.csv"
+    fe_output.to_csv(path, index=False)
+    feeder = FeReplicatorFeeder()
+    feeder.set_params(comparison_csv_path=str(path))
+    return feeder.compare_with_feature_eng_output(replicated, num_rows)
+
+
+def test_identical_output_is_exact_match(tmp_path, replicated):
+    result = _compare(tmp_path, replicated, replicated)
+
+    assert result["shape_match"] and result["columns_match"]
+    assert result["num_rows_compared"] == 1000
+    assert result["exact_match"]
+    assert result["mismatched_columns"] == []
+
+
+def test_shifted_timestamp_is_reported(tmp_path, replicated):
+    fe_output = replicated.copy()
+    fe_output.loc[500, "DATE_TIME"] += pd.Timedelta(minutes=1)
+
+    result = _compare(tmp_path, replicated, fe_output)
+
+    assert not result["exact_match"]
+    assert result["mismatched_columns"] == ["DATE_TIME"]
+
+
+def test_mismatched_columns_are_reported(tmp_path, replicated):
+    fe_output = replicated.copy()
+    fe_output.loc[500, "f3"] += 1e-3
+    fe_output.loc[600, "f5"] += 5.0
+
+    result = _compare(tmp_path, replicated, fe_output)
+
+    assert not result["exact_match"]
+    assert {"f3", "f5"} <= set(result["mismatched_columns"])
+    assert not {"DATE_TIME", "f0", "f1", "f2", "f4"} & set(result["mismatched_columns"])
+
+
+def test_nan_position_mismatch_is_reported(tmp_path, replicated):
+    fe_output = replicated.copy()
+    fe_output.loc[400, "f1"] = 0.5 if np.isnan(replicated.loc[400, "f1"]) else np.nan
+
+    result = _compare(tmp_path, replicated, fe_output)
+
+    assert result["mismatched_columns"] == ["f1"]
+
+
+def test_extra_column_fails_column_match(tmp_path, replicated):
+    fe_output = replicated.assign(extra=1.0)
+
+    result = _compare(tmp_path, replicated, fe_output)
+
+    assert not result["exact_match"]
+    assert not result["columns_match"]
+    assert result["mismatched_columns"] == []
+
+
+def test_report_printed_once_only_when_verbose(tmp_path, replicated, monkeypatch):
+    path = tmp_path / "feature_eng_output.csv"
+    replicated.to_csv(path, index=False)
+    feeder = FeReplicatorFeeder()
+    feeder.set_params(comparison_csv_path=str(path))
+    # Record prints on the module itself; quiet mode may filter builtins.print
+    printed = []
+    monkeypatch.setattr(fe_replicator_feeder, "print", printed.append, raising=False)
+
+    quiet = feeder.compare_with_feature_eng_output(replicated, 1000, verbose=False)
+    assert printed == []
+
+    verbose = feeder.compare_with_feature_eng_output(replicated, 1000, verbose=True)
+    assert verbose == quiet
+    assert quiet["exact_match"]
+    assert len(printed) == 1
+    assert "Starting exact comparison" in printed[0] and "PERFECT MATCH" in printed[0]
@@ -2,19 +2,47 @@ import warnings
 warnings.filterwarnings("ignore", category=DeprecationWarning, module="pkg_resources")
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
+import numpy as np
 import pandas as pd
 
 # Corrected import path
 from plugins_feeder.default_feeder import DefaultFeeder
 
+class _StubTicker:
+    """Minimal stand-in for ``yf.Ticker`` whose ``history`` returns a fixed frame."""
+
+    def __init__(self, df=None, error=None):
+        self._df = df
+        self._error = error
+
+    def history(self, *args, **kwargs):
+        if self._error is not None:
+            raise self._error
+        return self._df
+
+@pytest.fixture(scope="module")
+def stub_ticker_cls():
+    """Provides the lightweight ticker stub class."""
+    return _StubTicker
+
 @pytest.fixture
 def feeder():
     """Provides a DefaultFeeder instance for testing."""
     return DefaultFeeder()
 
+_NORM_PARAMS = {
+    "feature1": {"min": 0, "max": 10},
+    "feature2": {"min": 0, "max": 100},
+}
+
+@pytest.fixture(scope="module")
+def feeder_with_norm():
+    """Provides one DefaultFeeder with injected normalization params, shared by the module."""
+    return DefaultFeeder({"normalization_params": _NORM_PARAMS})
+
 @patch('plugins_feeder.default_feeder.yf.Ticker')
-def test_feeder_fetch_data_successfully(mock_yf_ticker, feeder):
+def test_feeder_fetch_data_successfully(mock_yf_ticker, feeder, stub_ticker_cls):
     """
     Tests the feeder's ability to retrieve and process data successfully.
     """
@@ -27,10 +55,8 @@ def test_feeder_fetch_data_successfully(mock_yf_ticker, feeder):
         'Volume': [1000, 1100, 1200]
     }, index=pd.date_range('2025-06-30', periods=3, freq='h'))
     
-    # Mock the ticker instance and its history method
-    mock_ticker_instance = MagicMock()
-    mock_ticker_instance.history.return_value = mock_df
-    mock_yf_ticker.return_value = mock_ticker_instance
+    # Stub the ticker instance and its history method
+    mock_yf_ticker.side_effect = lambda *a, **k: stub_ticker_cls(mock_df)
 
     # Execute the fetch method
     data = feeder.fetch()
@@ -42,7 +68,7 @@ def test_feeder_fetch_data_successfully(mock_yf_ticker, feeder):
     assert isinstance(data, pd.DataFrame)
 
 @patch('plugins_feeder.default_feeder.yf.Ticker')
-def test_feeder_handles_different_parameters(mock_yf_ticker, feeder):
+def test_feeder_handles_different_parameters(mock_yf_ticker, feeder, stub_ticker_cls):
     """
     Tests that the feeder correctly handles different parameter configurations.
     """
@@ -54,10 +80,8 @@ def test_feeder_handles_different_parameters(mock_yf_ticker, feeder):
         'Volume': [1100, 1200]
     }, index=pd.date_range('2025-07-01', periods=2, freq='h'))
     
-    # Mock the ticker instance and its history method
-    mock_ticker_instance = MagicMock()
-    mock_ticker_instance.history.return_value = mock_df
-    mock_yf_ticker.return_value = mock_ticker_instance
+    # Stub the ticker instance and its history method
+    mock_yf_ticker.side_effect = lambda *a, **k: stub_ticker_cls(mock_df)
 
     # Set different parameters
     feeder.set_params(instrument="AAPL", batch_size=128)
@@ -69,14 +93,52 @@ def test_feeder_handles_different_parameters(mock_yf_ticker, feeder):
     assert isinstance(data, pd.DataFrame)
 
 @patch('plugins_feeder.default_feeder.yf.Ticker')
-def test_feeder_handles_fetch_error(mock_yf_ticker, feeder):
+def test_feeder_handles_fetch_error(mock_yf_ticker, feeder, stub_ticker_cls):
     """
     Tests that the feeder plugin handles errors during data fetching gracefully.
     """
     # Mock yfinance to raise an exception
-    mock_ticker_instance = MagicMock()
-    mock_ticker_instance.history.side_effect = Exception("Network error")
-    mock_yf_ticker.return_value = mock_ticker_instance
+    mock_yf_ticker.side_effect = lambda *a, **k: stub_ticker_cls(error=Exception("Network error"))
     
     with pytest.raises(Exception):
         feeder.fetch()
+
+def test_feeder_uses_preparsed_normalization_params():
+    """
+    Tests that pre-parsed normalization params are used without touching the filesystem.
+    """
+    norm_params = {"Close": {"min": 100, "max": 110}}
+    feeder = DefaultFeeder({"normalization_params": norm_params,
+                            "use_normalization_json": "/nonexistent/norm.json"})
+
+    assert feeder.normalization_params is norm_params
+
+def test_feeder_reuses_parsed_normalization_json(tmp_path):
+    """
+    Tests that feeders reading the same unchanged normalization JSON file each
+    get their own parameters, so changes made by one do not leak into another.
+    """
+    norm_path = tmp_path / "norm.json"
+    norm_path.write_text('{"Close": {"min": 100, "max": 110}}')
+
+    first = DefaultFeeder({"use_normalization_json": str(norm_path)})
+    first.normalization_params["Close"]["min"] = 0
+    second = DefaultFeeder({"use_normalization_json": str(norm_path)})
+
+    assert second.normalization_params == {"Close": {"min": 100, "max": 110}}
+    assert second.normalization_params is not first.normalization_params
+
+@pytest.mark.parametrize("raw, expected", [
+    ({"feature1": [0, 5, 10], "feature2": [0, 50, 100]},
+     [[0.0, 0.0], [0.5, 0.5], [1.0, 1.0]]),
+    ({"feature1": [2.5, 7.5], "feature2": [25, 75]},
+     [[0.25, 0.25], [0.75, 0.75]]),
+])
+def test_normalization(feeder_with_norm, raw, expected):
+    """
+    Tests min-max normalization of the configured columns.
+    """
+    normalized_df = feeder_with_norm._normalize_data(pd.DataFrame(raw))
+
+    actual = normalized_df[["feature1", "feature2"]].to_numpy()
+    np.testing.assert_allclose(actual, np.array(expected), rtol=1e-7)
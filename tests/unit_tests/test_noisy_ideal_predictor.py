@@ -8,22 +8,27 @@ import pytest
 from plugins_predictor.noisy_ideal_predictor import NoisyIdealPredictor
 
 
-@pytest.fixture
-def sample_csv(tmp_path):
-    """Create a sample hourly OHLC CSV."""
+@pytest.fixture(scope="session")
+def _ohlc_template():
+    """Build the sample hourly OHLC frame once per session."""
     n = 200  # 200 hours (~8 days)
     dates = pd.date_range("2024-01-01", periods=n, freq="h")
     rng = np.random.default_rng(0)
     close = 1.1000 + np.cumsum(rng.normal(0, 0.0005, n))
-    df = pd.DataFrame({
+    return pd.DataFrame({
         "DATE_TIME": dates,
         "OPEN": close - rng.uniform(0, 0.0002, n),
         "HIGH": close + rng.uniform(0, 0.0005, n),
         "LOW": close - rng.uniform(0, 0.0005, n),
         "CLOSE": close,
     })
-    path = tmp_path / "test_ohlc.csv"
-    df.to_csv(path, index=False)
+
+
+@pytest.fixture(scope="module")
+def sample_csv(_ohlc_template, tmp_path_factory):
+    """Write the sample hourly OHLC CSV once; the predictor only reads it."""
+    path = tmp_path_factory.mktemp("noisy_ideal") / "test_ohlc.csv"
+    _ohlc_template.to_csv(path, index=False)
     return str(path)
 
 
@@ -0,0 +1,155 @@
+import json
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.json_cache import _read_text
+from plugins_predictor.default_predictor import DefaultPredictor
+
+# Keep TensorFlow-backed tests on one xdist worker under --dist=loadgroup
+pytestmark = pytest.mark.xdist_group("tf")
+
+# Normalization payload serialized once at import; fixtures write the bytes as-is
+_NORM_BYTES = json.dumps({"close_price": {"mean": 100, "std": 10}}).encode()
+
+# Constant normalized model output; mocked forward passes return read-only views of it
+_CONST = np.full((1, 1), 0.5, dtype=np.float32)
+
+def _const_output(inputs, *args, **kwargs):
+    return np.broadcast_to(_CONST, (len(inputs), 1))
+
+@pytest.fixture(scope="session")
+def mock_config(tmp_path_factory):
+    """
+    Provides a predictor configuration whose normalization JSON and dummy model
+    file are written once per session.
+    """
+    base_dir = tmp_path_factory.mktemp("pred")
+    norm_path = base_dir / "pred_norm.json"
+    norm_path.write_bytes(_NORM_BYTES)
+    model_path = base_dir / "model.keras"
+    model_path.write_bytes(b"")
+
+    return {
+        "model_path": str(model_path),
+        "normalization_params_path": str(norm_path),
+        "prediction_target_column": "close_price",
+        "mc_samples": 10,
+        "use_gpu": False,
+    }
+
+@pytest.fixture(scope="session")
+def mock_keras_model():
+    """Provides one stub Keras model shared by the whole session."""
+    model = MagicMock()
+    model.predict.side_effect = _const_output
+    model.side_effect = _const_output
+    return model
+
+@pytest.fixture(scope="session")
+def input_tensor():
+    """Provides a zero input window; the mocked model ignores its values."""
+    return np.zeros((1, 256, 44), dtype=np.float32)
+
+@pytest.fixture
+def predictor(mock_config, mock_keras_model):
+    """Provides a DefaultPredictor built from the shared configuration."""
+    mock_keras_model.reset_mock()
+    return DefaultPredictor(mock_config)
+
+def test_normalization_params_loaded(predictor):
+    """
+    Tests that normalization parameters are read from the configured JSON file.
+    """
+    assert predictor.normalization_params == {"close_price": {"mean": 100, "std": 10}}
+
+def test_normalization_params_reused(predictor, mock_config):
+    """
+    Tests that a second predictor reading the same unchanged file reuses the
+    cached text but gets its own parameters, unaffected by the first's changes.
+    """
+    predictor.normalization_params["close_price"]["mean"] = 0
+    hits = _read_text.cache_info().hits
+    other = DefaultPredictor(mock_config)
+
+    assert other.normalization_params == {"close_price": {"mean": 100, "std": 10}}
+    assert _read_text.cache_info().hits == hits + 1
+
+def test_load_model_successfully(predictor, mock_config, mock_keras_model):
+    """
+    Tests that load_model hands the configured path to Keras and that loading
+    the same path again reuses the predictor's cached model.
+    """
+    with patch("plugins_predictor.default_predictor.keras.models.load_model",
+               return_value=mock_keras_model) as mock_load_model:
+        assert predictor.load_model() is True
+        assert predictor.load_model() is True
+
+    assert mock_load_model.call_count == 1
+    assert mock_load_model.call_args.args[0] == mock_config["model_path"]
+    assert predictor.model is mock_keras_model
+
+def test_denormalization_logic(predictor):
+    """
+    Tests that predictions are scaled by std and shifted by mean, and that
+    uncertainties are only scaled.
+    """
+    preds, uncerts = predictor._denormalize(np.array([[0.5]]), np.array([[0.1]]))
+
+    np.testing.assert_allclose(preds, [[105.0]])
+    np.testing.assert_allclose(uncerts, [[1.0]])
+
+def test_denormalization_skipped_without_target(predictor):
+    """
+    Tests that de-normalization is a no-op when the target column has no stats.
+    """
+    del predictor.normalization_params["close_price"]
+
+    preds, uncerts = predictor._denormalize(np.array([[0.5]]), np.array([[0.1]]))
+
+    np.testing.assert_allclose(preds, [[0.5]])
+    np.testing.assert_allclose(uncerts, [[0.1]])
+
+def test_predict_with_uncertainty(predictor, mock_keras_model, input_tensor):
+    """
+    Tests that Monte Carlo samples that fit in one batch run as a single
+    forward pass and that a constant model yields zero spread around the
+    de-normalized mean.
+    """
+    predictor.model = mock_keras_model
+
+    result = predictor.predict_with_uncertainty(input_tensor, mc_samples=10)
+
+    assert mock_keras_model.call_count == 1
+    assert mock_keras_model.call_args.args[0].shape == (10, 256, 44)
+    assert mock_keras_model.call_args.kwargs == {"training": True}
+    assert result["metadata"]["mc_samples"] == 10
+    np.testing.assert_allclose(result["prediction"], [[105.0]])
+    np.testing.assert_allclose(result["uncertainty"], [[0.0]])
+    assert result["metadata"]["de_normalized"] is True
+
+def test_predict_with_uncertainty_chunks_forward_passes(predictor, mock_keras_model, input_tensor):
+    """
+    Tests that Monte Carlo samples beyond batch_size are split across forward
+    passes of at most batch_size rows and regrouped into one result.
+    """
+    predictor.model = mock_keras_model
+    predictor.set_params(batch_size=4)
+
+    result = predictor.predict_with_uncertainty(input_tensor, mc_samples=10)
+
+    assert [c.args[0].shape[0] for c in mock_keras_model.call_args_list] == [4, 4, 2]
+    assert all(c.kwargs == {"training": True} for c in mock_keras_model.call_args_list)
+    np.testing.assert_allclose(result["prediction"], [[105.0]])
+    np.testing.assert_allclose(result["uncertainty"], [[0.0]])
+
+
+def test_predict_with_uncertainty_rejects_zero_samples(predictor, mock_keras_model, input_tensor):
+    """Tests that mc_samples below one is rejected before any forward pass."""
+    predictor.model = mock_keras_model
+
+    with pytest.raises(ValueError, match="mc_samples"):
+        predictor.predict_with_uncertainty(input_tensor, mc_samples=0)
+
+    mock_keras_model.assert_not_called()
@@ -22,32 +22,58 @@ async def test_auth_middleware_valid_token():
     # Assert
     assert result == "test_key"
 
-def test_plugin_registration():
-    """
-    Tests that the PluginManager can register and retrieve a plugin.
-    """
-    # Arrange
+@pytest.fixture
+def mock_plugin():
+    """Provides a mock plugin exposing a name attribute."""
+    plugin = MagicMock()
+    plugin.name = "test_plugin"
+    return plugin
+
+@pytest.fixture
+def manager(mock_plugin):
+    """Provides a PluginManager with the mock plugin registered."""
     manager = PluginManager()
-    mock_plugin = MagicMock()
-    mock_plugin.name = "test_plugin"
+    manager.register(mock_plugin)
+    return manager
 
+@pytest.mark.parametrize("name, registered", [
+    ("test_plugin", True),
+    ("nonexistent_plugin", False),
+    (None, False),
+])
+def test_plugin_get(manager, mock_plugin, name, registered):
+    """
+    Tests that the PluginManager retrieves registered plugins by name and
+    returns None for names that were never registered.
+    """
     # Act
-    manager.register(mock_plugin)
-    retrieved_plugin = manager.get("test_plugin")
+    retrieved_plugin = manager.get(name)
 
     # Assert
-    assert retrieved_plugin is not None
-    assert retrieved_plugin == mock_plugin
+    if registered:
+        assert retrieved_plugin is not None
+        assert retrieved_plugin == mock_plugin
+    else:
+        assert retrieved_plugin is None
 
-def test_get_nonexistent_plugin():
+def test_plugin_register_non_str_name():
     """
-    Tests that asking for a non-existent plugin returns None.
+    Tests that plugins whose name is not a plain str can still be registered
+    and retrieved.
     """
     # Arrange
+    class PluginName(str):
+        pass
+
     manager = PluginManager()
+    str_subclass_plugin = MagicMock()
+    str_subclass_plugin.name = PluginName("subclass_plugin")
+    mock_name_plugin = MagicMock()
 
     # Act
-    retrieved_plugin = manager.get("nonexistent_plugin")
+    manager.register(str_subclass_plugin)
+    manager.register(mock_name_plugin)
 
     # Assert
-    assert retrieved_plugin is None
+    assert manager.get("subclass_plugin") is str_subclass_plugin
+    assert manager.get(mock_name_plugin.name) is mock_name_plugin
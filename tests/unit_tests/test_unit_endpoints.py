@@ -17,30 +17,25 @@ def test_valid_prediction_request():
     except ValidationError as e:
         pytest.fail(f"Validation failed unexpectedly: {e}")
 
-def test_invalid_request_missing_ticker():
+@pytest.mark.parametrize("invalid_data, field", [
+    pytest.param(
+        {"model_name": "default_model", "start_date": "2023-01-01", "end_date": "2023-12-31"},
+        "ticker",
+        id="missing_ticker",
+    ),
+    pytest.param(
+        {"ticker": "AAPL", "start_date": "not-a-date"},
+        "start_date",
+        id="bad_date_format",
+    ),
+])
+def test_invalid_prediction_request(invalid_data, field):
     """
-    Tests that a dictionary missing the required 'ticker' field raises a ValidationError.
+    Tests that a dictionary missing a required field or carrying an invalid
+    date format raises a ValidationError naming the offending field.
     """
-    invalid_data = {
-        "model_name": "default_model",
-        "start_date": "2023-01-01",
-        "end_date": "2023-12-31"
-    }
-    with pytest.raises(ValidationError) as excinfo:
-        PredictionRequest(**invalid_data)
-
-    # Check that the error message clearly indicates the missing field
-    assert "ticker" in str(excinfo.value)
-
-def test_invalid_request_bad_date_format():
-    """
-    Tests that a dictionary with an invalid date format raises a ValidationError.
-    """
-    invalid_data = {
-        "ticker": "AAPL",
-        "start_date": "not-a-date"
-    }
     with pytest.raises(ValidationError) as excinfo:
         PredictionRequest(**invalid_data)
 
-    assert "start_date" in str(excinfo.value)
+    # Check that the error message clearly indicates the offending field
+    assert field in str(excinfo.value)
@@ -1,78 +1,70 @@
 import warnings
 warnings.filterwarnings("ignore", category=DeprecationWarning, module="pkg_resources")
 
-import unittest
-from unittest.mock import patch, MagicMock
+import pytest
+from unittest.mock import call, patch
 import pandas as pd
-import yfinance as yf
 
 # Assuming the feeder plugin is in this path
 from plugins_feeder.default_feeder import DefaultFeeder
 
-class TestUnitFeeder(unittest.TestCase):
-    """
-    Unit tests for the DefaultFeeder plugin.
-    
-    These tests verify the feeder's logic in isolation, particularly its
-    ability to handle data fetching and process API responses correctly.
-    External dependencies, like the yfinance API, are mocked.
-    """
+# Unit tests for the DefaultFeeder plugin.
+#
+# These tests verify the feeder's logic in isolation, particularly its
+# ability to handle data fetching and process API responses correctly.
+# External dependencies, like the yfinance API, are mocked.
 
-    def setUp(self):
-        """Set up a fresh instance of the feeder for each test."""
-        self.feeder = DefaultFeeder()
+# Expected yfinance.download calls for the cases that reach the assertion
+_EXPECTED_DOWNLOAD = {
+    ticker: call(ticker, start="2025-07-01", end="2025-07-01")
+    for ticker in ("AAPL", "EMPTY")
+}
 
-    @patch('yfinance.download')
-    def test_fetch_data_success(self, mock_yf_download):
-        """
-        Test successful data fetching when the external API returns valid data.
-        """
-        # Arrange: Configure the mock to return a sample DataFrame
-        sample_data = pd.DataFrame({
-            'Open': [150.0], 'High': [152.5], 'Low': [149.0],
-            'Close': [152.0], 'Volume': [1000000]
-        }, index=pd.to_datetime(['2025-07-01']))
-        mock_yf_download.return_value = sample_data
+# Sample yfinance frame, built once at import with a pre-parsed index
+_SAMPLE = pd.DataFrame({
+    'Open': [150.0], 'High': [152.5], 'Low': [149.0],
+    'Close': [152.0], 'Volume': [1000000]
+}, index=pd.DatetimeIndex([pd.Timestamp("2025-07-01")]))
 
-        # Act: Call the method under test
-        result = self.feeder.fetch_data_sync("AAPL", "2025-07-01", "2025-07-01")
+@pytest.fixture
+def sample_df():
+    """Shallow copy of the sample frame; shares data blocks with _SAMPLE."""
+    return _SAMPLE.copy(deep=False)
 
-        # Assert: Verify the mock was called and the result is correct
-        mock_yf_download.assert_called_once_with(
-            "AAPL", start="2025-07-01", end="2025-07-01"
-        )
-        self.assertIsNotNone(result)
-        self.assertFalse(result.empty)
-        pd.testing.assert_frame_equal(result, sample_data)
+@pytest.fixture
+def feeder():
+    """Provides a fresh instance of the feeder for each test."""
+    return DefaultFeeder()
 
-    @patch('yfinance.download')
-    def test_fetch_data_api_error(self, mock_yf_download):
-        """
-        Test the feeder's behavior when the external API raises an exception.
-        """
+@pytest.mark.parametrize("ticker, outcome, expect_raises", [
+    pytest.param("AAPL", "sample", False, id="success"),
+    pytest.param("EMPTY", "empty", False, id="empty_dataframe"),
+    pytest.param("FAIL", Exception("API is down"), True, id="api_error"),
+])
+@patch('yfinance.download')
+def test_fetch_data(mock_yf_download, feeder, sample_df, ticker, outcome, expect_raises):
+    """
+    Test data fetching when the external API returns valid data, returns an
+    empty DataFrame, or raises an exception.
+    """
+    if expect_raises:
         # Arrange: Configure the mock to simulate an API error
-        mock_yf_download.side_effect = Exception("API is down")
-
-        # Act & Assert: Verify that the feeder handles the exception gracefully
-        with self.assertRaises(Exception) as context:
-            self.feeder.fetch_data_sync("FAIL", "2025-01-01", "2025-01-02")
-        
-        self.assertTrue("API is down" in str(context.exception))
+        mock_yf_download.side_effect = outcome
 
-    @patch('yfinance.download')
-    def test_fetch_data_empty_dataframe(self, mock_yf_download):
-        """
-        Test the feeder's behavior when the API returns an empty DataFrame.
-        """
-        # Arrange: Configure the mock to return an empty DataFrame
-        mock_yf_download.return_value = pd.DataFrame()
+        # Act & Assert: Verify that the feeder propagates the exception
+        with pytest.raises(Exception, match="API is down"):
+            feeder.fetch_data_sync(ticker, "2025-07-01", "2025-07-01")
+        return
 
-        # Act: Call the method under test
-        result = self.feeder.fetch_data_sync("EMPTY", "2025-01-01", "2025-01-02")
+    # Arrange: Configure the mock to return the requested DataFrame
+    expected = sample_df if outcome == "sample" else pd.DataFrame()
+    mock_yf_download.return_value = expected
 
-        # Assert: Verify the result is an empty DataFrame
-        self.assertIsNotNone(result)
-        self.assertTrue(result.empty)
+    # Act: Call the method under test
+    result = feeder.fetch_data_sync(ticker, "2025-07-01", "2025-07-01")
 
-if __name__ == '__main__':
-    unittest.main()
+    # Assert: Verify the mock was called and the result is returned unchanged
+    assert mock_yf_download.call_count == 1
+    assert mock_yf_download.call_args == _EXPECTED_DOWNLOAD[ticker]
+    assert result is not None
+    pd.testing.assert_frame_equal(result, expected)
@@ -1,68 +1,139 @@
-import unittest
+import pytest
 from unittest.mock import patch, MagicMock
 import numpy as np
 
 # Assuming the predictor plugin is in this path
-from plugins_predictor.default_predictor import DefaultPredictor
+from plugins_predictor.default_predictor import DefaultPredictor, PREDICTOR_INPUT_DTYPE
 
-class TestUnitPredictor(unittest.TestCase):
+# Unit tests for the DefaultPredictor plugin.
+#
+# These tests verify the predictor's internal logic, such as model path
+# construction and data processing, without loading a real model.
+
+# Keep TensorFlow-backed tests on one xdist worker under --dist=loadgroup
+pytestmark = pytest.mark.xdist_group("tf")
+
+# Sample input matching the expected 45 columns; the mocked model ignores its values
+_SAMPLE_INPUT = np.zeros((1, 128, 45), dtype=PREDICTOR_INPUT_DTYPE)
+
+# Batch of sample inputs for the vectorized predict path
+_BATCH_INPUT = np.zeros((32, 128, 45), dtype=PREDICTOR_INPUT_DTYPE)
+
+def _mock_model(*args, **kwargs):
+    """Builds a mocked Keras model predicting 0.5 with uncertainty 0.6 per row."""
+    model = MagicMock()
+    model.predict.side_effect = lambda inputs: np.tile([[0.5, 0.6]], (len(inputs), 1))
+    return model
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_tf_load():
+    """Patches the predictor's Keras load_model once for the whole module."""
+    with patch('plugins_predictor.default_predictor.keras.models.load_model') as mock_load_model:
+        yield mock_load_model
+
+@pytest.fixture(autouse=True)
+def _reset_tf_load(_patch_tf_load):
+    """Clears calls and return values recorded by the shared load_model mock."""
+    yield
+    _patch_tf_load.reset_mock(return_value=True, side_effect=True)
+
+@pytest.fixture
+def predictor():
+    """Set up a fresh instance of the predictor for each test."""
+    predictor = DefaultPredictor()
+    # Mock the internal state that would be set by the framework
+    predictor.model_dir = "plugins_predictor/models"
+    return predictor
+
+def test_model_loader_logic(predictor):
+    """
+    Test Case 3.1: Verify the model path construction logic.
+    """
+    # Arrange
+    model_name = "my_test_model"
+    expected_path = "plugins_predictor/models/my_test_model.keras"
+
+    # Act
+    # Accessing a protected method for this unit test is acceptable.
+    actual_path = predictor._get_model_path(model_name)
+
+    # Assert
+    assert actual_path == expected_path
+
+def test_model_cache_evicts_least_recently_used(predictor, _patch_tf_load):
+    """
+    Verify the model cache stays bounded and evicts the least recently used model.
     """
-    Unit tests for the DefaultPredictor plugin.
+    # Arrange
+    predictor.set_params(model_cache_size=2)
+    _patch_tf_load.side_effect = _mock_model
+
+    # Act: Load a and b, touch a again, then load c to force an eviction
+    for model_name in ("a", "b", "a", "c"):
+        predictor.predict(model_name, _SAMPLE_INPUT)
+
+    # Assert
+    assert list(predictor.model_cache) == [
+        "plugins_predictor/models/a.keras",
+        "plugins_predictor/models/c.keras",
+    ]
+    assert _patch_tf_load.call_count == 3
+
+def test_prediction_with_mock_model(predictor, _patch_tf_load):
+    """
+    Test Case 3.2: Ensure the predict method processes data correctly
+    using a mocked model.
+    """
+    # Arrange
+    # Configure the mock model to return a predictable output
+    mock_model = MagicMock()
+    mock_model.predict.return_value = np.array([[0.5, 0.6]]) # Mocked prediction and uncertainty
+    _patch_tf_load.return_value = mock_model
+
+    # Act: Call the predict method twice with the same model
+    predictor.predict("mock_model", _SAMPLE_INPUT)
+    result = predictor.predict("mock_model", _SAMPLE_INPUT)
+
+    # Assert
+    # Verify the model was loaded once and reused from the cache
+    _patch_tf_load.assert_called_once_with("plugins_predictor/models/mock_model.keras", custom_objects={})
+    assert mock_model.predict.call_count == 2
+    assert mock_model.predict.call_args.args[0].dtype == PREDICTOR_INPUT_DTYPE
     
-    These tests verify the predictor's internal logic, such as model path
-    construction and data processing, without loading a real model.
+    # Verify the output is correctly formatted
+    assert "prediction" in result
+    assert "uncertainty" in result
+    np.testing.assert_array_equal(result["prediction"], [0.5])
+    np.testing.assert_array_equal(result["uncertainty"], [0.6])
+
+def test_batch_prediction_with_mock_model(predictor, _patch_tf_load):
+    """
+    Ensure a whole batch is predicted with a single model.predict call.
+    """
+    # Arrange
+    mock_model = MagicMock()
+    mock_model.predict.return_value = np.tile([[0.5, 0.6]], (len(_BATCH_INPUT), 1))
+    _patch_tf_load.return_value = mock_model
+
+    # Act
+    result = predictor.predict("mock_model", _BATCH_INPUT)
+
+    # Assert
+    assert mock_model.predict.call_count == 1
+    np.testing.assert_array_equal(result["prediction"], np.full(len(_BATCH_INPUT), 0.5))
+    np.testing.assert_array_equal(result["uncertainty"], np.full(len(_BATCH_INPUT), 0.6))
+
+def test_prediction_input_cast_to_model_dtype(predictor, _patch_tf_load):
+    """
+    Ensure float64 input reaches the model in the predictor's input dtype.
     """
+    # Arrange
+    mock_model = MagicMock()
+    mock_model.predict.return_value = np.array([[0.5, 0.6]])
+    _patch_tf_load.return_value = mock_model
 
-    def setUp(self):
-        """Set up a fresh instance of the predictor for each test."""
-        self.predictor = DefaultPredictor()
-        # Mock the internal state that would be set by the framework
-        self.predictor.model_dir = "plugins_predictor/models"
-
-    def test_model_loader_logic(self):
-        """
-        Test Case 3.1: Verify the model path construction logic.
-        """
-        # Arrange
-        model_name = "my_test_model"
-        expected_path = "plugins_predictor/models/my_test_model.keras"
-
-        # Act
-        # Accessing a protected method for this unit test is acceptable.
-        actual_path = self.predictor._get_model_path(model_name)
-
-        # Assert
-        self.assertEqual(actual_path, expected_path)
-
-    @patch('tensorflow.keras.models.load_model')
-    def test_prediction_with_mock_model(self, mock_load_model):
-        """
-        Test Case 3.2: Ensure the predict method processes data correctly
-        using a mocked model.
-        """
-        # Arrange
-        # Configure the mock model to return a predictable output
-        mock_model = MagicMock()
-        mock_model.predict.return_value = np.array([[0.5, 0.6]]) # Mocked prediction and uncertainty
-        mock_load_model.return_value = mock_model
-
-        # Create sample input data matching the expected 45 columns
-        sample_input = np.random.rand(1, 128, 45) 
-
-        # Act: Call the predict method
-        result = self.predictor.predict("mock_model", sample_input)
-
-        # Assert
-        # Verify the model was loaded and its predict method was called
-        mock_load_model.assert_called_once_with("plugins_predictor/models/mock_model.keras")
-        mock_model.predict.assert_called_once()
-        
-        # Verify the output is correctly formatted
-        self.assertIn("prediction", result)
-        self.assertIn("uncertainty", result)
-        self.assertEqual(result["prediction"], 0.5)
-        self.assertEqual(result["uncertainty"], 0.6)
-
-if __name__ == '__main__':
-    unittest.main()
+    # Act
+    predictor.predict("mock_model", _SAMPLE_INPUT.astype(np.float64))
 
+    # Assert
+    assert mock_model.predict.call_args.args[0].dtype == PREDICTOR_INPUT_DTYPE